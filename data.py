@@ -1,19 +1,35 @@
-import sqlite3
-
-# Function to clear the database
-def clear_database():
-    conn = sqlite3.connect("call_analysis.db")
-    cursor = conn.cursor()
-
-    # Delete all records but keep the table structure
-    cursor.execute("DELETE FROM call_reports;")
-
-    # Reset auto-increment ID (optional)
-    cursor.execute("DELETE FROM sqlite_sequence WHERE name='call_reports';")
-
-    conn.commit()
-    conn.close()
-    print("Database cleared successfully!")
-
-# Run the function
-clear_database()
+import sqlite3
+
+# Function to clear the database
+def clear_database():
+    conn = sqlite3.connect("call_analysis.db")
+
+    # Run both deletes in a single transaction: one commit (and one fsync)
+    # instead of two round-trips to disk
+    with conn:
+        # Delete all records but keep the table structure
+        conn.execute("DELETE FROM call_reports;")
+
+        # Reset auto-increment ID (optional)
+        conn.execute("DELETE FROM sqlite_sequence WHERE name='call_reports';")
+
+    conn.close()
+    print("Database cleared successfully!")
+
+# Bulk-insert helper for loading many reports at once: executemany inside a
+# single transaction instead of a commit per row
+def insert_reports(rows):
+    conn = sqlite3.connect("call_analysis.db")
+    with conn:
+        conn.executemany('''INSERT INTO call_reports
+            (customer_name, agent_name, customer_satisfied, company_improvements)
+            VALUES (?, ?, ?, ?)''', rows)
+
+    # Refresh the query planner's statistics after a bulk load so future
+    # queries plan against the real table size
+    conn.execute("ANALYZE")
+    conn.close()
+
+# Run the function
+if __name__ == "__main__":
+    clear_database()
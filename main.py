@@ -1,157 +1,254 @@
-import streamlit as st
-import torch
-import whisper
-import os
-import sqlite3
-from langchain_groq import ChatGroq
-from langchain_core.messages import HumanMessage
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-
-def create_database():
-    conn = sqlite3.connect("call_analysis.db")
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS call_reports (
-                      id INTEGER PRIMARY KEY AUTOINCREMENT,
-                      customer_service_department TEXT,
-                      agent_name TEXT DEFAULT 'Unknown',
-                      customer_name TEXT DEFAULT 'Unknown',
-                      summary TEXT,
-                      overall_sentiment TEXT CHECK(overall_sentiment IN ('Positive', 'Negative', 'Neutral')),
-                      customer_satisfied TEXT CHECK(customer_satisfied IN ('Yes', 'No')),
-                      main_attention_areas TEXT)''')
-    conn.commit()
-    conn.close()
-
-create_database()
-
-# Streamlit UI
-st.title("Customer Call Analyzer")
-
-page = st.sidebar.radio("Navigation", ["Home", "Reports"])
-
-if page == "Home":
-    st.write("Upload an audio file (.wav or .mp3) to analyze the conversation.")
-    uploaded_file = st.file_uploader("Choose an audio file", type=["wav", "mp3"])
-    
-    if uploaded_file is not None:
-        filename = os.path.join("temp_audio", uploaded_file.name)
-        os.makedirs("temp_audio", exist_ok=True)
-        
-        with open(filename, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        st.success("File uploaded successfully!")
-        
-        # Load Whisper model
-        model = whisper.load_model("base")
-        
-        # Transcribe audio
-        with st.spinner("Transcribing..."):
-            result = model.transcribe(filename)
-            transcription = result["text"]
-        
-        st.subheader("Transcription")
-        st.text_area("", transcription, height=200)
-        
-        # Use LLaMA via Groq API for analysis
-        llm = ChatGroq(api_key=GROQ_API_KEY, model_name="llama3-8b-8192")
-        
-        # Summarization
-        summary_prompt = f"""
-        Summarize the following customer support conversation:
-        {transcription}
-        """
-        messages = [HumanMessage(content=summary_prompt)]
-        summary = llm(messages)
-        st.subheader("Summary")
-        st.write(summary.content if hasattr(summary, 'content') else summary)
-        
-        # Extract key details for database storage
-        name_prompt = f"""
-        Extract only the names of the agent and customer from this conversation in JSON format:
-        {{"agent_name": "<agent_name>", "customer_name": "<customer_name>"}}
-        If unknown, use "Unknown".
-        {transcription}
-        """
-        name_result = llm([HumanMessage(content=name_prompt)])
-        agent_name, customer_name = "Unknown", "Unknown"
-        
-        if name_result and hasattr(name_result, 'content'):
-            import json
-            try:
-                name_data = json.loads(name_result.content)
-                agent_name = name_data.get("agent_name", "Unknown").strip()
-                customer_name = name_data.get("customer_name", "Unknown").strip()
-            except json.JSONDecodeError:
-                pass
-        
-        sentiment_prompt = f"""
-        Classify the overall sentiment of the customer's conversation strictly as Positive, Negative, or Neutral.
-        Only return one of these three words without any explanation:
-        {transcription}
-        """
-        sentiment_result = llm([HumanMessage(content=sentiment_prompt)])
-        overall_sentiment = sentiment_result.content.strip()
-        
-        satisfaction_prompt = f"""
-        Was the customer satisfied at the end of the call? Answer only Yes or No.
-        {transcription}
-        """
-        satisfaction_result = llm([HumanMessage(content=satisfaction_prompt)])
-        customer_satisfied = satisfaction_result.content.strip()
-        
-        attention_prompt = f"""
-        Identify key topics or main areas of attention in short comma-separated keywords only (e.g., billing, technical issue, refund):
-        {transcription}
-        """
-        attention_result = llm([HumanMessage(content=attention_prompt)])
-        main_attention_areas = attention_result.content.strip()
-        
-        # Store in SQLite database
-        conn = sqlite3.connect("call_analysis.db")
-        cursor = conn.cursor()
-        cursor.execute('''INSERT INTO call_reports (customer_service_department, agent_name, customer_name, summary, overall_sentiment, customer_satisfied, main_attention_areas)
-                          VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                       ("Unknown", agent_name, customer_name, summary.content, overall_sentiment, customer_satisfied, main_attention_areas))
-        conn.commit()
-        conn.close()
-        
-        # Generate alternative responses
-        response_prompt = f"""
-        Extract all responses given by the agent from the following conversation. Identify responses that may not have effectively addressed the customer’s concerns. 
-        
-        Format the output as follows:
-        - Old Response: "<original agent response>"
-        - Upgraded Response: "<better alternative>"
-        - Reason for improvement: "<explanation>"
-        
-        Ensure the upgraded response is clear, empathetic, and directly addresses customer concerns. Do not include customer statements in the output.
-        
-        Conversation:
-        {transcription}
-        """
-        messages = [HumanMessage(content=response_prompt)]
-        alternative_response = llm(messages)
-        
-        st.subheader("Alternative Response Suggestions")
-        st.write(alternative_response.content if hasattr(alternative_response, 'content') else alternative_response)
-        
-        # Clean up
-        os.remove(filename)
-
-elif page == "Reports":
-    st.title("Call Reports")
-    conn = sqlite3.connect("call_analysis.db")
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, agent_name, customer_name, overall_sentiment, customer_satisfied, main_attention_areas FROM call_reports")
-    data = cursor.fetchall()
-    conn.close()
-    
-    if data:
-        st.table([{ "ID": row[0], "Agent Name": row[1], "Customer Name": row[2], "Sentiment": row[3], "Satisfied": row[4], "Attention Areas": row[5] } for row in data])
-    else:
-        st.write("No records found.")
+# -------------------------------
+# 📦 Imports
+# -------------------------------
+import streamlit as st
+import torch
+import io
+import os
+import sqlite3
+import json
+import pandas as pd
+from faster_whisper import WhisperModel
+from langchain_groq import ChatGroq
+from langchain_core.messages import HumanMessage
+from dotenv import load_dotenv
+
+# -------------------------------
+# 🔐 Load Environment Variables
+# -------------------------------
+load_dotenv()
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# -------------------------------
+# 🧠 Cached Model Factories
+# -------------------------------
+
+# Streamlit reruns this whole script on every widget interaction, so cache the
+# heavy model objects and build them only once per server process
+@st.cache_resource
+def get_whisper():
+    # Transcribe on the GPU when one is available; int8_float16 keeps the
+    # quantized weights while doing the math in fp16
+    if torch.cuda.is_available():
+        return WhisperModel("base", device="cuda", compute_type="int8_float16")
+    # CTranslate2 defaults to 4 intra-op threads; give it every core on the box
+    return WhisperModel("base", device="cpu", compute_type="int8",
+                        cpu_threads=os.cpu_count() or 4)
+
+@st.cache_resource
+def get_llm():
+    return ChatGroq(api_key=GROQ_API_KEY, model_name="llama-3.1-8b-instant", temperature=0.2)
+
+# Keyed by the raw audio bytes: re-uploading the same call (or rerunning with
+# the file still selected) returns the cached transcript without touching Whisper
+@st.cache_data(show_spinner=False)
+def transcribe_audio(audio_bytes):
+    segments, _ = get_whisper().transcribe(io.BytesIO(audio_bytes), vad_filter=True)
+    return "".join(segment.text for segment in segments).strip()
+
+# Keyed by the full prompt (which embeds the transcript), so identical calls
+# are answered from cache instead of a fresh Groq round-trip
+@st.cache_data(show_spinner=False)
+def run_llm(prompt):
+    # The structured analysis is short-form; an explicit completion cap lets
+    # Groq schedule the request faster and guards against runaway output
+    # response_format makes Groq constrain decoding to valid JSON, so the
+    # reply can be parsed directly instead of fished out with a regex
+    result = get_llm().bind(max_tokens=1024,
+                            response_format={"type": "json_object"}).invoke([HumanMessage(content=prompt)])
+    return result.content if hasattr(result, 'content') else str(result)
+
+# -------------------------------
+# 🧰 Database Setup and Schema Update
+# -------------------------------
+
+# One persistent connection per server process instead of reconnecting on
+# every query; check_same_thread=False because Streamlit script runs may
+# land on different threads
+@st.cache_resource
+def get_connection():
+    conn = sqlite3.connect("call_analysis.db", check_same_thread=False)
+    # WAL appends commits to a log instead of rewriting pages in place (and
+    # lets the Reports page read while an insert is in flight); synchronous
+    # NORMAL then skips the per-commit fsync, which WAL makes safe
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+# Ensures the call_reports table has the right columns
+def update_database_schema():
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA table_info(call_reports);")
+    existing_columns = [column[1] for column in cursor.fetchall()]
+
+    # Add missing column if it's not already there
+    if "company_improvements" not in existing_columns:
+        cursor.execute("ALTER TABLE call_reports ADD COLUMN company_improvements TEXT;")
+        conn.commit()
+
+# Creates the database table if it doesn't exist
+def create_database():
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS call_reports (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_name TEXT DEFAULT 'Unknown',
+            agent_name TEXT DEFAULT 'Unknown',
+            customer_satisfied TEXT CHECK(customer_satisfied IN ('Yes', 'No')),
+            company_improvements TEXT
+        )
+    ''')
+    conn.commit()
+
+# Schema setup only needs to happen once per server process, not on every
+# rerun; cache the (None) result so the DDL and PRAGMA checks are skipped
+# after the first run
+@st.cache_resource
+def init_database():
+    create_database()
+    update_database_schema()
+
+# Call database setup once
+init_database()
+
+# -------------------------------
+# 🎛️ Streamlit UI Setup
+# -------------------------------
+st.title("📞 Customer Call Analyzer")
+page = st.sidebar.radio("Navigation", ["Home", "Reports"])
+
+# -------------------------------
+# 🏠 Home Page: Upload & Analyze Call
+# -------------------------------
+if page == "Home":
+    st.write("Upload an audio file (.wav or .mp3) to analyze the conversation.")
+    uploaded_file = st.file_uploader("Choose an audio file", type=["wav", "mp3"])
+
+    if uploaded_file:
+        st.success("✅ File uploaded successfully!")
+
+        # Transcribe audio straight from the in-memory upload, memoized on the
+        # file's bytes so the same audio is never transcribed twice
+        with st.spinner("🔄 Transcribing audio..."):
+            transcription = transcribe_audio(uploaded_file.getvalue())
+
+        st.subheader("📝 Transcription")
+        st.text_area("", transcription, height=200)
+
+        # -------------------------------
+        # 🧠 Analyze the Conversation (single fused LLM call)
+        # -------------------------------
+        # One prompt covering all five analyses: the transcription is sent
+        # once instead of five times, and only one round-trip is paid.
+        analysis_prompt = f"""
+        Analyze the following customer support conversation.
+        Respond strictly with a single JSON object, no preamble, in this exact format:
+        {{
+          "summary": "<concise summary of the conversation>",
+          "agent_name": "<agent name, or "Unknown">",
+          "customer_name": "<customer name, or "Unknown">",
+          "customer_satisfied": "<Yes or No>",
+          "company_improvements": "<short comma-separated list of issues the company should improve, or "No issues reported.">"
+        }}
+        Conversation:
+        {transcription}
+        """
+
+        with st.spinner("🔄 Analyzing conversation..."):
+            analysis_content = run_llm(analysis_prompt)
+
+        # JSON mode guarantees syntactically valid JSON, so parse it directly
+        analysis = {}
+        if analysis_content:
+            try:
+                analysis = json.loads(analysis_content)
+            except json.JSONDecodeError:
+                st.warning("⚠️ Failed to parse the analysis response.")
+                st.code(analysis_content)
+
+        summary = analysis.get("summary", "")
+        agent_name = (analysis.get("agent_name") or "Unknown").strip()
+        customer_name = (analysis.get("customer_name") or "Unknown").strip()
+        customer_satisfied = (analysis.get("customer_satisfied") or "").strip()
+        company_improvements = (analysis.get("company_improvements") or "").strip()
+
+        st.subheader("📑 Summary")
+        st.write(summary)
+
+        # -------------------------------
+        # 💾 Save Analyzed Data to SQLite
+        # -------------------------------
+        # Only persist a successfully parsed analysis: a truncated or
+        # malformed response would otherwise insert a junk row, and an empty
+        # customer_satisfied trips the CHECK constraint on a fresh database
+        if analysis:
+            # Normalize to the CHECK-constrained Yes/No domain
+            if customer_satisfied not in ("Yes", "No"):
+                customer_satisfied = "Yes" if customer_satisfied.lower().startswith("y") else "No"
+
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute('''INSERT INTO call_reports
+                (customer_name, agent_name, customer_satisfied, company_improvements)
+                VALUES (?, ?, ?, ?)''',
+                (customer_name, agent_name, customer_satisfied, company_improvements))
+            conn.commit()
+        else:
+            st.warning("⚠️ Analysis could not be parsed, so this call was not saved to Reports.")
+
+        # -------------------------------
+        # 🧠 Improved Agent Responses
+        # -------------------------------
+        response_prompt = f"""
+        - no preamble
+        Extract all agent responses and identify weak ones. Provide better alternatives and explain why.
+
+        Format:
+        - Old Response: "<original>"
+        - Upgraded Response: "<better version>"
+        - Reason for improvement: "<why it's better>"
+
+        Use "----------------------------" to separate entries.
+
+        Conversation:
+        {transcription}
+        """
+
+        st.subheader("🗣️ Alternative Response Suggestions")
+        # This is the longest completion by far; stream it token by token so
+        # the user reads suggestions while they generate instead of staring
+        # at a spinner until the full response lands
+        st.write_stream(chunk.content for chunk in get_llm().stream([HumanMessage(content=response_prompt)]))
+
+# -------------------------------
+# 📊 Reports Page: View Past Calls
+# -------------------------------
+elif page == "Reports":
+    st.title("📊 Call Reports")
+
+    # Fetch records from DB straight into a DataFrame (single C-level pass,
+    # no intermediate fetchall list or manual column bookkeeping)
+    df = pd.read_sql_query('''SELECT id AS "ID",
+                                     customer_name AS "Customer Name",
+                                     agent_name AS "Agent Name",
+                                     customer_satisfied AS "Satisfied",
+                                     company_improvements AS "Company Improvements"
+                              FROM call_reports''', get_connection())
+
+    if not df.empty:
+        # Improve table visuals using HTML/CSS
+        st.markdown("""
+        <style>
+            .stDataFrame { overflow-x: auto; }
+            table { width: 100% !important; }
+            th { background-color: #4CAF50; color: white; text-align: left; }
+            td, th { padding: 10px; border-bottom: 1px solid #ddd; }
+        </style>
+        """, unsafe_allow_html=True)
+
+        st.dataframe(df, width=1500, height=500)
+    else:
+        st.write("❌ No records found.")